@@ -1,7 +1,12 @@
 """Configuration module - Singleton Pattern"""
 
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .platform_info import IS_WINDOWS
+
 
 class Config:
     """Singleton configuration manager (DRY principle)"""
@@ -18,6 +23,17 @@ class Config:
         self.WINDOW_SIZE = (1000, 1000)
         self.MIN_SIZE = (1000, 1000)
         self.BACKUP_ROOT = Path.home() / "StardewValleyCrossSaves_Backups"
+        # Remembers the last link backup so Restore still works after a restart
+        self.STATE_PATH = Path.home() / ".stardew_cross_save_state.json"
+        # Decorative photo behind the UI, off by default: the flat 'bg' color costs no
+        # decode/rescale (slow machines, X forwarding). Set True to show background.jpg
+        self.SHOW_BACKGROUND = False
+        
+        # Shared I/O pool for file copies, reused by every command for the app lifetime.
+        # Copies release the GIL; Windows filter drivers (cloud providers, AV) serialize beyond ~4
+        self.IO_WORKERS = 4 if IS_WINDOWS else min(32, (os.cpu_count() or 1) * 4)
+        self.executor = ThreadPoolExecutor(max_workers=self.IO_WORKERS, thread_name_prefix="sv-io")
+        atexit.register(self.executor.shutdown, cancel_futures=True)
         
         # Color palette (Stardew Valley theme)
         self.COLORS = {
@@ -46,4 +62,7 @@ class Config:
             'button_small': ('Georgia', 11, 'bold'),
             'entry': ('Courier', 11),
             'log': ('Courier', 10),
+            'banner_icon': ('Arial', 28),
+            'banner_title': ('Georgia', 11, 'bold'),
+            'banner_text': ('Georgia', 10, 'bold'),
         }
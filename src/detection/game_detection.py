@@ -1,59 +1,116 @@
 """Game Detection Service - Detects game installation and saves (SRP)"""
 
-import platform
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from ..platform_info import IS_WINDOWS, IS_MACOS, IS_LINUX
 from .path_detector import PathDetector
 
 
+def _fold(name: str) -> str:
+    """Compare names the way the host filesystem does (case-insensitive off Linux)"""
+    return name if IS_LINUX else name.casefold()
+
+
+@lru_cache(maxsize=None)
+def _list_dir(path: str) -> Optional[frozenset[str]]:
+    """Child names of a directory from one scandir, or None if it can't be read"""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(_fold(entry.name) for entry in it)
+    except OSError:
+        return None
+
+
 class GameDetectionService:
     """Service for detecting game installation and saves"""
+    __slots__ = ('path_detector', '_cache', '_validate_install')
+    
+    CACHE_TTL = 60.0  # seconds a detection result is reused before re-scanning
     
     def __init__(self, path_detector: PathDetector):
         self.path_detector = path_detector
+        self._cache: dict[str, tuple[float, Optional[Path]]] = {}
+        # Platform-specific validation, chosen once instead of per candidate
+        if IS_MACOS:
+            self._validate_install = self._is_macos_install
+        elif IS_WINDOWS:
+            self._validate_install = self._is_windows_install
+        else:
+            self._validate_install = self._is_linux_install
+    
+    def _cached(self, key: str, scan: Callable[[], Optional[Path]]) -> Optional[Path]:
+        """Return a memoized scan result, re-scanning once it is older than CACHE_TTL"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < self.CACHE_TTL:
+                return entry[1]
+            self.invalidate()
+        
+        result = scan()
+        self._cache[key] = (time.monotonic(), result)
+        return result
     
     def find_saves_path(self) -> Optional[Path]:
         """Find game saves directory"""
+        return self._cached('saves', self._scan_saves_path)
+    
+    def find_installation(self) -> Optional[Path]:
+        """Find game installation directory"""
+        return self._cached('install', self._scan_installation)
+    
+    def invalidate(self) -> None:
+        """Drop cached results so the next lookup re-scans (e.g. user rescan)"""
+        self._cache.clear()
+        _list_dir.cache_clear()
+    
+    def _scan_saves_path(self) -> Optional[Path]:
+        """Check each candidate saves directory on disk"""
         for path in self.path_detector.get_saves_paths():
-            if path.exists() and path.is_dir():
+            # Misses are answered by the parent's cached listing, shared across candidates
+            siblings = _list_dir(str(path.parent))
+            if siblings is not None and _fold(path.name) in siblings and path.is_dir():
                 return path
         return None
     
-    def find_installation(self) -> Optional[Path]:
-        """Find game installation directory"""
+    def _scan_installation(self) -> Optional[Path]:
+        """Check each candidate installation directory on disk"""
         for game_path in self.path_detector.get_install_paths():
-            if not game_path.exists():
+            # One directory read per candidate answers every child check below
+            children = _list_dir(str(game_path))
+            if children is None:
                 continue
             
-            # Platform-specific validation
-            system = platform.system().lower()
-            if system == "darwin":
-                # Check if it's a .app bundle (macOS)
-                if game_path.suffix == ".app":
-                    return game_path
-                # Or a Steam installation folder (has Contents directory)
-                elif (game_path / "Contents").exists():
-                    return game_path
-                # Or contains a .app bundle
-                elif (game_path / "Stardew Valley.app").exists():
-                    return game_path
-            elif system.startswith("win"):
-                exe_path = game_path / "Stardew Valley.exe"
-                if exe_path.exists():
-                    return game_path
-            else:  # Linux
-                exe_path = game_path / "Stardew Valley"
-                if exe_path.exists():
-                    return game_path
+            if self._validate_install(game_path, children):
+                return game_path
         
         return None
     
+    @staticmethod
+    def _is_macos_install(game_path: Path, children: frozenset[str]) -> bool:
+        """A .app bundle, a Steam folder (has Contents) or a folder holding the .app"""
+        return (game_path.suffix == ".app"
+                or _fold("Contents") in children
+                or _fold("Stardew Valley.app") in children)
+    
+    @staticmethod
+    def _is_windows_install(game_path: Path, children: frozenset[str]) -> bool:
+        """Folder containing the game executable"""
+        return _fold("Stardew Valley.exe") in children
+    
+    @staticmethod
+    def _is_linux_install(game_path: Path, children: frozenset[str]) -> bool:
+        """Folder containing the game launcher"""
+        return _fold("Stardew Valley") in children
+    
     def get_platform_hint(self) -> str:
         """Get helpful hint for current platform"""
-        system = platform.system().lower()
-        if system == "darwin":
+        if IS_MACOS:
             return "macOS: typical Saves = ~/Library/Application Support/StardewValley/Saves"
-        elif system.startswith("win"):
+        elif IS_WINDOWS:
             return "Windows: typical Saves = %AppData%\\StardewValley\\Saves"
         else:
             return "Linux: typical Saves = ~/.config/StardewValley/Saves"
@@ -1,84 +1,97 @@
 """Path Detector - Platform-specific path detection (Strategy Pattern)"""
 
 import os
-import platform
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 
+from ..platform_info import IS_WINDOWS, IS_MACOS
+
+# Where every Steam library keeps the game, relative to the library root
+_STEAM_GAME = Path("steamapps") / "common" / "Stardew Valley"
+
 
 class PathDetector(ABC):
-    """Abstract detector for platform-specific paths"""
+    """Abstract detector for platform-specific paths (candidates are built once, at import)"""
+    __slots__ = ()  # stateless: the candidate tuples are class attributes, not on self
     
     @abstractmethod
-    def get_saves_paths(self) -> list[Path]:
+    def get_saves_paths(self) -> tuple[Path, ...]:
         """Get possible save file paths"""
         pass
     
     @abstractmethod
-    def get_install_paths(self) -> list[Path]:
+    def get_install_paths(self) -> tuple[Path, ...]:
         """Get possible game installation paths"""
         pass
 
 
 class MacOSPathDetector(PathDetector):
-    def get_saves_paths(self) -> list[Path]:
-        return [
-            Path.home() / "Library" / "Application Support" / "StardewValley" / "Saves",
-            Path.home() / ".config" / "StardewValley" / "Saves"
-        ]
+    __slots__ = ()
+    _SAVES_PATHS = (
+        Path.home() / "Library" / "Application Support" / "StardewValley" / "Saves",
+        Path.home() / ".config" / "StardewValley" / "Saves"
+    )
+    _INSTALL_PATHS = (
+        Path("/Applications/Stardew Valley.app"),
+        Path.home() / "Applications" / "Stardew Valley.app",
+        Path.home() / "Library" / "Application Support" / "Steam" / _STEAM_GAME,
+        Path("/Applications/Stardew Valley GOG.app")
+    )
+    
+    def get_saves_paths(self) -> tuple[Path, ...]:
+        return self._SAVES_PATHS
     
-    def get_install_paths(self) -> list[Path]:
-        return [
-            Path("/Applications/Stardew Valley.app"),
-            Path.home() / "Applications" / "Stardew Valley.app",
-            Path.home() / "Library" / "Application Support" / "Steam" / "steamapps" / "common" / "Stardew Valley",
-            Path("/Applications/Stardew Valley GOG.app")
-        ]
+    def get_install_paths(self) -> tuple[Path, ...]:
+        return self._INSTALL_PATHS
 
 
 class WindowsPathDetector(PathDetector):
-    def get_saves_paths(self) -> list[Path]:
-        appdata = os.getenv("APPDATA")
-        if appdata:
-            return [Path(appdata) / "StardewValley" / "Saves"]
-        return []
+    __slots__ = ()
+    _APPDATA = os.getenv("APPDATA")
+    _SAVES_PATHS = (Path(_APPDATA) / "StardewValley" / "Saves",) if _APPDATA else ()
+    # A missing candidate costs the scan one failed scandir, so no exists() probe here
+    _INSTALL_PATHS = (
+        Path("C:/Program Files (x86)/Steam") / _STEAM_GAME,
+        Path("C:/Program Files/Steam") / _STEAM_GAME,
+        Path("C:/GOG Games/Stardew Valley"),
+        Path("C:/Program Files (x86)/GOG Galaxy/Games/Stardew Valley"),
+        Path.home() / "AppData" / "Local" / "Steam" / _STEAM_GAME
+    )
     
-    def get_install_paths(self) -> list[Path]:
-        paths = [
-            Path("C:/Program Files (x86)/Steam/steamapps/common/Stardew Valley"),
-            Path("C:/Program Files/Steam/steamapps/common/Stardew Valley"),
-            Path("C:/GOG Games/Stardew Valley"),
-            Path("C:/Program Files (x86)/GOG Galaxy/Games/Stardew Valley")
-        ]
-        
-        steam_config = Path.home() / "AppData" / "Local" / "Steam"
-        if steam_config.exists():
-            paths.append(steam_config / "steamapps" / "common" / "Stardew Valley")
-        
-        return paths
+    def get_saves_paths(self) -> tuple[Path, ...]:
+        return self._SAVES_PATHS
+    
+    def get_install_paths(self) -> tuple[Path, ...]:
+        return self._INSTALL_PATHS
 
 
 class LinuxPathDetector(PathDetector):
-    def get_saves_paths(self) -> list[Path]:
-        return [Path.home() / ".config" / "StardewValley" / "Saves"]
+    __slots__ = ()
+    _SAVES_PATHS = (Path.home() / ".config" / "StardewValley" / "Saves",)
+    _INSTALL_PATHS = (
+        Path.home() / ".steam" / "steam" / _STEAM_GAME,
+        Path.home() / ".local" / "share" / "Steam" / _STEAM_GAME,
+        Path.home() / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam" / _STEAM_GAME
+    )
+    
+    def get_saves_paths(self) -> tuple[Path, ...]:
+        return self._SAVES_PATHS
     
-    def get_install_paths(self) -> list[Path]:
-        return [
-            Path.home() / ".steam" / "steam" / "steamapps" / "common" / "Stardew Valley",
-            Path.home() / ".local" / "share" / "Steam" / "steamapps" / "common" / "Stardew Valley",
-            Path.home() / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam" / "steamapps" / "common" / "Stardew Valley"
-        ]
+    def get_install_paths(self) -> tuple[Path, ...]:
+        return self._INSTALL_PATHS
 
 
 class PathDetectorFactory:
     """Factory for creating platform-specific path detectors"""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create() -> PathDetector:
-        system = platform.system().lower()
-        if system.startswith("win"):
+        # Detectors are stateless and the platform is fixed, so build one per process
+        if IS_WINDOWS:
             return WindowsPathDetector()
-        elif system == "darwin":
+        elif IS_MACOS:
             return MacOSPathDetector()
         else:
             return LinuxPathDetector()
@@ -1,6 +1,6 @@
 """Commands - Command Pattern for undoable operations"""
 
-import shutil
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,6 +13,8 @@ from .file_operations import FileOperations
 
 class Command(ABC):
     """Abstract command for operations (Command Pattern)"""
+    # Empty slots here let the concrete commands drop their per-instance __dict__
+    __slots__ = ()
     
     @abstractmethod
     def execute(self) -> 'OperationResult':
@@ -30,7 +32,7 @@ class Command(ABC):
         pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationResult:
     """Result of an operation (Value Object)"""
     success: bool
@@ -40,6 +42,7 @@ class OperationResult:
 
 class MigrateCommand(Command):
     """Command to migrate saves to cloud"""
+    __slots__ = ('game_saves', 'cloud_saves', 'logger', 'backup_path')
     
     def __init__(self, game_saves: Path, cloud_saves: Path, logger: Callable[[str], None]):
         self.game_saves = game_saves
@@ -69,6 +72,8 @@ class MigrateCommand(Command):
 
 class LinkCommand(Command):
     """Command to link saves to cloud"""
+    __slots__ = ('game_saves', 'cloud_saves', 'link_strategy', 'config', 'logger',
+                 'backup_path')
     
     def __init__(self, game_saves: Path, cloud_saves: Path, link_strategy: LinkStrategy, 
                  config: Config, logger: Callable[[str], None]):
@@ -91,16 +96,23 @@ class LinkCommand(Command):
                            "Use 'Restore Backup' first."
                 )
             
-            # Ensure cloud folder exists
+            # Ensure cloud folder's parent exists
+            FileOperations.ensure_directory(self.cloud_saves.parent)
+            
+            if self._can_move():
+                return self._move_and_link()
+            
             FileOperations.ensure_directory(self.cloud_saves)
             
             # Copy saves to cloud BEFORE removing local
             self.logger("[LINK] Copying saves to cloud folder...")
             FileOperations.copy_contents(self.game_saves, self.cloud_saves, overwrite=True)
             
-            # Backup original saves
+            # Backup original saves (hardlink snapshot is safe: the originals are removed next)
             self.logger("[LINK] Creating backup...")
-            self.backup_path = FileOperations.backup_folder(self.game_saves, self.config.BACKUP_ROOT)
+            self.backup_path = FileOperations.backup_folder(
+                self.game_saves, self.config.BACKUP_ROOT, hardlink=True
+            )
             self.logger(f"[BACKUP] Created: {self.backup_path}")
             
             # Remove original folder
@@ -120,6 +132,49 @@ class LinkCommand(Command):
         except Exception as e:
             return OperationResult(success=False, message=str(e))
     
+    def _can_move(self) -> bool:
+        """Saves can simply be renamed into an empty cloud folder on the same volume"""
+        try:
+            same_volume = (os.stat(self.game_saves).st_dev
+                           == os.stat(self.cloud_saves.parent).st_dev)
+        except OSError:
+            return False
+        if not same_volume:
+            return False
+        if not self.cloud_saves.exists():
+            return True
+        return self.cloud_saves.is_dir() and not any(self.cloud_saves.iterdir())
+    
+    def _move_and_link(self) -> OperationResult:
+        """Fast path: rename the Saves folder into the cloud instead of copy + delete"""
+        # Real (copy-on-write where possible) copy: the moved originals stay live in the
+        # cloud, so a hardlink snapshot would be rewritten along with them
+        self.logger("[LINK] Creating backup...")
+        self.backup_path = FileOperations.backup_folder(
+            self.game_saves, self.config.BACKUP_ROOT
+        )
+        self.logger(f"[BACKUP] Created: {self.backup_path}")
+        
+        self.logger("[LINK] Moving saves to cloud folder...")
+        if self.cloud_saves.exists():
+            self.cloud_saves.rmdir()
+        os.rename(self.game_saves, self.cloud_saves)
+        
+        self.logger("[LINK] Creating symlink/junction...")
+        try:
+            self.link_strategy.create_link(self.game_saves, self.cloud_saves)
+        except Exception:
+            # Put the saves back where the game expects them
+            os.rename(self.cloud_saves, self.game_saves)
+            raise
+        
+        self.logger("[OK] Link created successfully! Saves are now synced via cloud.")
+        return OperationResult(
+            success=True,
+            message="Link created successfully!",
+            backup_path=self.backup_path
+        )
+    
     def can_undo(self) -> bool:
         return self.backup_path is not None and self.backup_path.exists()
     
@@ -128,24 +183,30 @@ class LinkCommand(Command):
         if not self.can_undo():
             raise RuntimeError("No backup available to restore")
         
-        # Remove link
-        if self.game_saves.exists():
-            self.link_strategy.remove_link(self.game_saves)
+        # Remove link (a no-op when there is none)
+        self.link_strategy.remove_link(self.game_saves)
         
         # Restore backup
-        shutil.copytree(self.backup_path, self.game_saves)
+        FileOperations.copy_tree(self.backup_path, self.game_saves)
         self.logger(f"[UNDO] Restored from backup: {self.backup_path}")
 
 
 class RestoreCommand(Command):
-    """Command to restore from backup"""
+    """Command to restore from backup
+    
+    move=True renames the backup back into place instead of copying it (instant on
+    the same volume), consuming the backup.
+    """
+    __slots__ = ('game_saves', 'backup_path', 'link_strategy', 'logger', 'move')
     
     def __init__(self, game_saves: Path, backup_path: Optional[Path], 
-                 link_strategy: LinkStrategy, logger: Callable[[str], None]):
+                 link_strategy: LinkStrategy, logger: Callable[[str], None],
+                 move: bool = False):
         self.game_saves = game_saves
         self.backup_path = backup_path
         self.link_strategy = link_strategy
         self.logger = logger
+        self.move = move
     
     def execute(self) -> OperationResult:
         try:
@@ -156,11 +217,13 @@ class RestoreCommand(Command):
                 )
             
             self.logger("[RESTORE] Removing link/junction...")
-            if self.game_saves.exists():
-                self.link_strategy.remove_link(self.game_saves)
+            self.link_strategy.remove_link(self.game_saves)
             
             self.logger(f"[RESTORE] Restoring from {self.backup_path}...")
-            shutil.copytree(self.backup_path, self.game_saves)
+            if self.move:
+                FileOperations.move_folder(self.backup_path, self.game_saves)
+            else:
+                FileOperations.copy_tree(self.backup_path, self.game_saves)
             
             self.logger("[OK] Restore complete!")
             return OperationResult(success=True, message="Backup restored successfully!")
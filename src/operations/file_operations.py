@@ -1,9 +1,285 @@
 """File Operations - Facade Pattern for file system operations"""
 
+import ctypes
+import ctypes.util
+import errno
+import hashlib
 import os
 import shutil
+import stat
 import time
+from concurrent.futures import Executor, as_completed, wait
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from ..config import Config
+from ..platform_info import IS_LINUX, IS_MACOS, IS_WINDOWS
+
+if IS_LINUX:
+    import fcntl
+
+# copy_file_range errors that only mean "not supported here" - retry with shutil
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+# os.link errors meaning "hardlinks not possible here" (other volume, FAT, link limit)
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EINVAL, errno.EMLINK,
+                         errno.EOPNOTSUPP, errno.ENOTSUP}
+# FICLONE ioctl errors meaning "this filesystem can't reflink" - copy the bytes instead
+_CLONE_FALLBACK_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL,
+                          errno.ENOTTY, errno.ENOSYS}
+_FICLONE = 0x40049409  # linux/fs.h: share extents copy-on-write (btrfs, XFS, bcachefs)
+_HASH_CHUNK = 1 << 20
+_TMP_SUFFIX = ".svcs-tmp"
+_IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003  # winnt.h: directory junction
+
+
+def _load_clonefile():
+    """Bind macOS clonefile(2) (APFS copy-on-write), or None if unavailable"""
+    if not IS_MACOS:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_clonefile = _load_clonefile()
+
+
+def _load_copyfile_w():
+    """Bind Win32 CopyFileW (in-kernel copy) where shutil doesn't use it already"""
+    if not IS_WINDOWS:
+        return None
+    import _winapi
+    if hasattr(_winapi, 'CopyFile2'):  # Python 3.12+: shutil.copy2 goes native itself
+        return None
+    from ctypes import wintypes
+    copyfile = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    copyfile.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    copyfile.restype = wintypes.BOOL
+    return copyfile
+
+
+_copyfile_w = _load_copyfile_w()
+
+
+def _copy_file_range(src: str, dst: str) -> None:
+    """Copy file data in-kernel (reflink clone where supported, no userspace buffer)"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        if IS_LINUX:
+            try:
+                fcntl.ioctl(out_fd, _FICLONE, in_fd)
+                return
+            except OSError as e:
+                if e.errno not in _CLONE_FALLBACK_ERRNOS:
+                    raise
+        
+        remaining = os.fstat(in_fd).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(in_fd, out_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+def _copy_clonefile(src: str, dst: str) -> None:
+    """macOS: APFS copy-on-write clone (data and metadata), copy2 where it can't clone"""
+    if _clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        shutil.copy2(src, dst)
+
+
+def _copy_copyfile_w(src: str, dst: str) -> None:
+    """Windows: CopyFileW copies data, attributes and timestamps without a userspace buffer"""
+    if not _copyfile_w(src, dst, False):
+        shutil.copy2(src, dst)
+
+
+def _copy_in_kernel(src: str, dst: str) -> None:
+    """Linux and other copy_file_range systems: reflink or in-kernel copy, then metadata"""
+    try:
+        _copy_file_range(src, dst)
+    except OSError as e:
+        if e.errno not in _FALLBACK_ERRNOS:
+            raise
+        shutil.copy2(src, dst)
+    else:
+        shutil.copystat(src, dst)
+
+
+# Copy a file with metadata, using the fastest mechanism the OS offers (picked once)
+if _clonefile is not None:
+    _copy_file = _copy_clonefile
+elif _copyfile_w is not None:
+    _copy_file = _copy_copyfile_w
+elif hasattr(os, 'copy_file_range'):
+    _copy_file = _copy_in_kernel
+else:
+    _copy_file = shutil.copy2
+
+
+def _stamp_dirs(dirs: list) -> None:
+    """Copy directory stats bottom-up (writing children bumps a folder's mtime)"""
+    for src, dst in reversed(dirs):
+        shutil.copystat(src, dst)
+
+
+def _remove_dirs(dirs: list) -> None:
+    """Remove now-empty directories deepest first"""
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
+def _run_jobs(walk: Callable[[Callable, list], None], executor: Optional[Executor],
+              finish: Callable[[list], None] = _stamp_dirs) -> None:
+    """Run a walk's file jobs on the pool as they are found, then finish its dirs"""
+    executor = executor or Config().executor
+    futures, dirs = [], []
+    
+    def submit(func, *args):
+        futures.append(executor.submit(func, *args))
+    
+    try:
+        walk(submit, dirs)
+        for future in as_completed(futures):
+            future.result()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
+    
+    finish(dirs)
+
+
+def _copy_tree(src: str, dst: str, submit: Callable, dirs: list,
+               copy_func=_copy_file) -> None:
+    """Create the dst skeleton (one scandir per folder), submitting its file copies"""
+    os.makedirs(dst)
+    dirs.append((src, dst))
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _copy_tree(entry.path, target, submit, dirs, copy_func)
+            elif entry.is_symlink():
+                # Copy the link's content (like copytree did): a hardlink to the link
+                # itself could dangle once the originals are gone
+                submit(_copy_file, entry.path, target)
+            else:
+                submit(copy_func, entry.path, target)
+
+
+def _same_device(src: Path, dst: Path) -> bool:
+    """Whether dst (or its nearest existing parent, if not created yet) is on src's volume"""
+    src_dev = os.stat(src).st_dev
+    for probe in (dst, *dst.parents):
+        try:
+            return os.stat(probe).st_dev == src_dev
+        except FileNotFoundError:
+            continue
+    return False
+
+
+def _is_junction(st: os.stat_result) -> bool:
+    """Windows junctions lstat as directories, but must be unlinked, never descended"""
+    return getattr(st, 'st_reparse_tag', 0) == _IO_REPARSE_TAG_MOUNT_POINT
+
+
+def _remove_tree(path: str, submit: Callable, dirs: list) -> None:
+    """Collect folders top-down (one scandir each), submitting every other unlink"""
+    dirs.append(path)
+    with os.scandir(path) as it:
+        for entry in it:
+            # entry.stat() is only needed (and free - scandir has it) on Windows
+            if entry.is_dir(follow_symlinks=False) and not (
+                    IS_WINDOWS and _is_junction(entry.stat(follow_symlinks=False))):
+                _remove_tree(entry.path, submit, dirs)
+            else:
+                submit(os.unlink, entry.path)  # files, symlinks and junctions alike
+
+
+def _file_digest(path: str) -> bytes:
+    """BLAKE2b digest of a file's contents"""
+    # BLAKE2b is the fastest strong hash in hashlib; 128 bits is ample for equality checks
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(_HASH_CHUNK)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while read := f.readinto(buffer):
+            digest.update(view[:read])
+    return digest.digest()
+
+
+def _sync_file(entry: os.DirEntry, dst: str) -> None:
+    """Bring dst up to date with entry, skipping the write if nothing changed"""
+    # DirEntry.stat() runs here in the worker (and is free on Windows - readdir has it)
+    src, src_st = entry.path, entry.stat()
+    try:
+        dst_st = os.lstat(dst)
+    except FileNotFoundError:
+        dst_st = None
+    
+    if dst_st is not None:
+        if stat.S_ISDIR(dst_st.st_mode):
+            shutil.rmtree(dst)
+        elif stat.S_ISREG(dst_st.st_mode) and dst_st.st_size == src_st.st_size:
+            if dst_st.st_mtime_ns == src_st.st_mtime_ns:
+                return
+            if _file_digest(src) == _file_digest(dst):
+                shutil.copystat(src, dst)
+                return
+    
+    # Write beside the target and swap it in, so sync clients see one finished file
+    tmp = dst + _TMP_SUFFIX
+    try:
+        _copy_file(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _sync_entries(entries: Iterable[os.DirEntry], dst: str, submit: Callable,
+                  dirs: list) -> None:
+    """Sync every source entry into the existing dst directory"""
+    for entry in entries:
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            _sync_tree(entry.path, target, submit, dirs)
+        else:
+            submit(_sync_file, entry, target)
+
+
+def _sync_tree(src: str, dst: str, submit: Callable, dirs: list) -> None:
+    """Make dst an exact mirror of src, rewriting only what changed"""
+    try:
+        if not stat.S_ISDIR(os.lstat(dst).st_mode):
+            os.unlink(dst)
+            os.mkdir(dst)
+    except FileNotFoundError:
+        os.mkdir(dst)
+    
+    dirs.append((src, dst))
+    with os.scandir(src) as it:
+        entries = list(it)
+    
+    # Prune before this folder's jobs start, so in-flight temp files are never swept up
+    names = {entry.name for entry in entries}
+    with os.scandir(dst) as it:
+        stale = [entry for entry in it if entry.name not in names]
+    for entry in stale:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    
+    _sync_entries(entries, dst, submit, dirs)
 
 
 class FileOperations:
@@ -11,8 +287,8 @@ class FileOperations:
     
     @staticmethod
     def normalize_path(path: str) -> str:
-        """Normalize a path string"""
-        return str(Path(path).expanduser().resolve())
+        """Normalize a path string (lexically - no filesystem access)"""
+        return os.path.abspath(os.path.expanduser(path))
     
     @staticmethod
     def ensure_directory(path: Path) -> None:
@@ -22,42 +298,89 @@ class FileOperations:
     @staticmethod
     def path_exists(path: str) -> bool:
         """Check if path exists"""
-        try:
-            return Path(path).exists()
-        except Exception:
-            return False
+        return os.path.exists(path)  # one stat, never raises
     
     @staticmethod
-    def copy_contents(src: Path, dst: Path, overwrite: bool = True) -> None:
+    def is_directory(path: str) -> bool:
+        """Check if path is an existing directory (links are followed)"""
+        return os.path.isdir(path)
+    
+    @staticmethod
+    def copy_contents(src: Path, dst: Path, overwrite: bool = True,
+                      executor: Optional[Executor] = None) -> None:
         """Copy contents from src to dst"""
         FileOperations.ensure_directory(dst)
         
-        for item in src.iterdir():
-            s = src / item.name
-            d = dst / item.name
-            
-            if s.is_dir():
-                if d.exists() and overwrite:
-                    shutil.rmtree(d)
-                shutil.copytree(s, d)
-            else:
-                if d.exists() and overwrite:
-                    d.unlink()
-                shutil.copy2(s, d)
+        def walk(submit, dirs):
+            with os.scandir(src) as it:
+                if overwrite:
+                    # Delta sync: unchanged files are left alone so clouds don't re-upload them
+                    _sync_entries(it, str(dst), submit, dirs)
+                    return
+                
+                for entry in it:
+                    d = os.path.join(dst, entry.name)
+                    
+                    if entry.is_dir():
+                        _copy_tree(entry.path, d, submit, dirs)
+                    else:
+                        submit(_copy_file, entry.path, d)
+        
+        _run_jobs(walk, executor)
+    
+    @staticmethod
+    def copy_tree(src: Path, dst: Path, executor: Optional[Executor] = None) -> None:
+        """Copy a directory tree to a new dst (parallel shutil.copytree)"""
+        _run_jobs(partial(_copy_tree, str(src), str(dst)), executor)
     
     @staticmethod
-    def backup_folder(src: Path, backup_root: Path) -> Path:
-        """Create a timestamped backup"""
-        FileOperations.ensure_directory(backup_root)
+    def move_folder(src: Path, dst: Path, executor: Optional[Executor] = None) -> None:
+        """Move a directory tree to a new dst (a rename on the same volume)"""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            FileOperations.copy_tree(src, dst, executor)
+            FileOperations.remove_path(src, executor)
+    
+    @staticmethod
+    def backup_folder(src: Path, backup_root: Path, executor: Optional[Executor] = None,
+                      hardlink: bool = False) -> Path:
+        """Create a timestamped backup
+        
+        hardlink=True makes a metadata-only snapshot; only use it when src is removed
+        right after, since both share file contents until then. Falls back to a real
+        copy where hardlinks aren't possible (other volume, FAT, ...).
+        """
+        # No separate mkdir of backup_root: _copy_tree's makedirs creates it on demand
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = backup_root / f"backup_{timestamp}"
-        shutil.copytree(src, backup_path)
+        
+        # Two stats rule out the common cross-volume case before any skeleton is built
+        if hardlink and _same_device(src, backup_root):
+            try:
+                _run_jobs(partial(_copy_tree, str(src), str(backup_path), copy_func=os.link),
+                          executor)
+                return backup_path
+            except OSError as e:
+                if e.errno not in _LINK_FALLBACK_ERRNOS:
+                    raise
+                shutil.rmtree(backup_path, ignore_errors=True)
+        
+        FileOperations.copy_tree(src, backup_path, executor)
         return backup_path
     
     @staticmethod
-    def remove_path(path: Path) -> None:
-        """Remove a file or directory"""
-        if path.is_dir():
-            shutil.rmtree(path)
+    def remove_path(path: Path, executor: Optional[Executor] = None) -> None:
+        """Remove a file or directory (already gone counts as removed)"""
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return
+        
+        # Links are removed themselves - walking one would empty its target
+        if stat.S_ISDIR(st.st_mode) and not _is_junction(st):
+            _run_jobs(partial(_remove_tree, str(path)), executor, finish=_remove_dirs)
         else:
-            path.unlink()
+            os.unlink(path)
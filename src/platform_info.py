@@ -0,0 +1,9 @@
+"""Platform Info - Host platform resolved once at import (DRY)"""
+
+import platform
+
+# platform.system() may shell out to `uname`; resolve it a single time per process
+SYSTEM = platform.system().lower()
+IS_WINDOWS = SYSTEM.startswith("win")
+IS_MACOS = SYSTEM == "darwin"
+IS_LINUX = not (IS_WINDOWS or IS_MACOS)
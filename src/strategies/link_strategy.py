@@ -1,13 +1,28 @@
 """Link Strategy - Platform-specific link operations (Strategy Pattern)"""
 
 import os
-import subprocess
+import stat
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from ..platform_info import IS_WINDOWS
+
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+if IS_WINDOWS:
+    import _winapi
+    import ctypes
+    from ctypes import wintypes
+    
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+
 
 class LinkStrategy(ABC):
     """Abstract strategy for platform-specific link operations"""
+    __slots__ = ()  # strategies are stateless
     
     @abstractmethod
     def create_link(self, link_path: Path, target_path: Path) -> None:
@@ -27,6 +42,7 @@ class LinkStrategy(ABC):
 
 class SymlinkStrategy(LinkStrategy):
     """Strategy for Unix-like systems (macOS, Linux)"""
+    __slots__ = ()
     
     def create_link(self, link_path: Path, target_path: Path) -> None:
         try:
@@ -41,30 +57,33 @@ class SymlinkStrategy(LinkStrategy):
             return False
     
     def remove_link(self, path: Path) -> None:
-        if path.exists() and self.is_link(path):
-            path.unlink()
+        # One lstat answers "is there a link here?" - also for a dangling one,
+        # which exists() (it follows the link) would have reported as missing
+        try:
+            if stat.S_ISLNK(os.lstat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 class JunctionStrategy(LinkStrategy):
     """Strategy for Windows (junction points)"""
+    __slots__ = ()
     
     def create_link(self, link_path: Path, target_path: Path) -> None:
-        cmd = ["cmd", "/c", "mklink", "/J", str(link_path), str(target_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='cp850', errors='ignore')
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() or result.stdout.strip() or "mklink failed"
-            raise RuntimeError(f"Failed to create junction: {error_msg}")
+        # Native mount-point reparse point (what mklink /J does) - no cmd.exe spawn,
+        # no locale-dependent output, no admin rights; errors carry the real WinError
+        try:
+            _winapi.CreateJunction(str(target_path), str(link_path))
+        except OSError as e:
+            raise RuntimeError(f"Failed to create junction: {e}")
     
     def is_link(self, path: Path) -> bool:
-        if not path.exists():
-            return False
-        try:
-            cmd = ["cmd", "/c", "fsutil", "reparsepoint", "query", str(path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='cp850', errors='ignore')
-            return result.returncode == 0
-        except Exception:
-            return False
+        # One attribute read instead of spawning cmd.exe + fsutil (which also needs admin)
+        attrs = _GetFileAttributesW(str(path))
+        return attrs != INVALID_FILE_ATTRIBUTES and bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT)
     
     def remove_link(self, path: Path) -> None:
-        if path.exists() and self.is_link(path):
-            path.unlink()
+        # is_link reads the junction's own attributes (missing -> False), works dangling too
+        if self.is_link(path):
+            os.unlink(path)
@@ -1,6 +1,8 @@
 """Platform Factory - Creates platform-specific strategies (Factory Pattern)"""
 
-import platform
+from functools import lru_cache
+
+from ..platform_info import IS_WINDOWS, IS_MACOS
 from .link_strategy import LinkStrategy, SymlinkStrategy, JunctionStrategy
 
 
@@ -8,19 +10,19 @@ class PlatformFactory:
     """Factory for creating platform-specific strategies"""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_link_strategy() -> LinkStrategy:
-        system = platform.system().lower()
-        if system.startswith("win"):
+        # Strategies are stateless and the platform is fixed, so build one per process
+        if IS_WINDOWS:
             return JunctionStrategy()
         else:
             return SymlinkStrategy()
     
     @staticmethod
     def get_platform_name() -> str:
-        system = platform.system().lower()
-        if system == "darwin":
+        if IS_MACOS:
             return "macOS"
-        elif system.startswith("win"):
+        elif IS_WINDOWS:
             return "Windows"
         else:
             return "Linux"
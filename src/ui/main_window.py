@@ -1,22 +1,92 @@
 """Main Window - Main application UI (Template Method Pattern)"""
 
+import json
+import queue
+import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from tkinter import filedialog, messagebox
-from typing import Optional
-from PIL import Image, ImageTk
+from typing import Callable, Optional
 
 from .. import __version__
 from ..config import Config
+from ..platform_info import IS_WINDOWS, IS_MACOS
 from ..strategies import PlatformFactory
 from ..detection import PathDetectorFactory, GameDetectionService
-from ..operations import FileOperations, MigrateCommand, LinkCommand, RestoreCommand
+from ..operations import (
+    Command, FileOperations, MigrateCommand, LinkCommand, RestoreCommand, OperationResult
+)
 from .widget_factory import WidgetFactory
 
+# Bundled images (project root/assets, also where PyInstaller's --add-data puts them)
+_ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
+_LOGO_PATH = _ASSETS_DIR / "logo.png"
+_LOGO_ICO_PATH = _ASSETS_DIR / "logo.ico"
+_BACKGROUND_PATH = _ASSETS_DIR / "background.jpg"
+
+# File manager command for _open_folder (Linux: the desktop's default via xdg-open)
+_FOLDER_OPENER = "explorer" if IS_WINDOWS else "open" if IS_MACOS else "xdg-open"
+
+# Image modes pic-scale can resample directly
+_PIC_SCALE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "I;16", "F"})
+
+
+@lru_cache(maxsize=None)
+def _pic_scale():
+    """Optional SIMD resampler (pip install pic-scale), or None to use Pillow"""
+    try:
+        import pic_scale
+    except ImportError:
+        return None
+    return pic_scale
+
+
+@lru_cache(maxsize=8)
+def _resize_plan(src_size: tuple[int, int], dst_size: tuple[int, int], mode: str):
+    """pic-scale plan for one size pair (filter weights computed once, then reused)"""
+    ps = _pic_scale()
+    return ps.Plan(src_size, dst_size, ps.Resampling.BILINEAR, mode)
+
+
+@lru_cache(maxsize=None)
+def _decoded_image(path: Path, max_size: Optional[tuple[int, int]] = None):
+    """Open and fully decode an image asset once; resizes start from this copy
+    
+    max_size bounds the cached copy, so every later resize starts from at most that
+    many pixels (JPEGs are then also decoded at a reduced scale by libjpeg).
+    """
+    from PIL import Image
+    with Image.open(path) as img:
+        if max_size:
+            img.thumbnail(max_size, Image.Resampling.BILINEAR)
+        img.load()
+        return img.copy()
+
+
+def _resize_image(img, size: tuple[int, int]):
+    """Resize a PIL image, through pic-scale when it is installed"""
+    # Cheap box reduce by the integer ratio first; the filter then only covers the rest
+    factor = min(img.width // max(size[0], 1), img.height // max(size[1], 1))
+    if factor >= 2:
+        img = img.reduce(factor)
+    
+    if _pic_scale() is not None and img.mode in _PIC_SCALE_MODES:
+        return _resize_plan(img.size, size, img.mode).resize(img)
+    
+    from PIL import Image
+    return img.resize(size, Image.Resampling.BILINEAR)
+
 
 class StardewCrossSaveApp(tk.Tk):
     """Main application (uses composition over inheritance)"""
     
+    POLL_MS = 50  # how often the UI picks up log lines/results from a running command
+    RESIZE_DEBOUNCE_MS = 150  # background is rescaled once resizing pauses this long
+    MIN_BG_SIZE = 100  # below this (either side) nobody sees the background
+    MAX_LOG_LINES = 2000  # older lines are dropped so the Text widget stays fast
+    
     def __init__(self):
         super().__init__()
         
@@ -31,7 +101,17 @@ class StardewCrossSaveApp(tk.Tk):
         self.game_saves_var = tk.StringVar()
         self.cloud_root_var = tk.StringVar()
         self.cloud_saves_var = tk.StringVar()
-        self.last_backup: Optional[Path] = None
+        self.last_backup: Optional[Path] = self._load_last_backup()
+        # Last auto-detected Saves path: a rescan may replace it, never a hand-picked one
+        self._detected_saves: Optional[str] = None
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._action_buttons: list[tk.Button] = []
+        self._busy = False
+        self._resize_after_id: Optional[str] = None
+        self._last_cloud_root: Optional[str] = None
+        # One worker: rescales run in order and never share a pic-scale plan
+        self._bg_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sv-bg")
+        self._bg_size: Optional[tuple[int, int]] = None
         
         # Setup window
         self._setup_window()
@@ -47,45 +127,101 @@ class StardewCrossSaveApp(tk.Tk):
         
         # Set icon
         try:
-            icon_path = Path(__file__).parent.parent.parent / "assets" / "logo.png"
-            if icon_path.exists():
-                icon = tk.PhotoImage(file=str(icon_path))
-                self.iconphoto(True, icon)
+            if IS_WINDOWS and _LOGO_ICO_PATH.exists():
+                # Native ICO loader: no PNG decode, and Windows picks the size per DPI
+                self.iconbitmap(default=str(_LOGO_ICO_PATH))
+            elif _LOGO_PATH.exists():
+                # The PNG icon needs a decode: do it after the first paint, like the logo
+                self.after_idle(self._load_icon)
         except Exception:
             pass
         
-        # Background image
-        self._load_background()
-        self.bind("<Configure>", self._on_resize)
+        # Background image (without it the window keeps its flat 'bg' color)
+        if self.config.SHOW_BACKGROUND:
+            self._load_background()
+            # Every child inherits the toplevel's <Configure> binding; filter in Tcl so no
+            # Python Event is built for the dozens of child events per layout pass
+            on_resize = self.register(self._on_resize)
+            self.tk.call("bind", self._w, "<Configure>",
+                         f'if {{"%W" eq "{self._w}"}} {{{on_resize} %w %h}}')
         self.last_size = self.config.WINDOW_SIZE
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
     
-    def _load_background(self):
-        """Load background image"""
+    def _load_icon(self):
+        """Set the window icon from the PNG logo (macOS/Linux)"""
         try:
-            bg_path = Path(__file__).parent.parent.parent / "assets" / "background.jpg"
-            if bg_path.exists():
-                w, h = self.winfo_width() or self.config.WINDOW_SIZE[0], \
-                       self.winfo_height() or self.config.WINDOW_SIZE[1]
-                img = Image.open(bg_path)
-                img = img.resize((w, h), Image.Resampling.LANCZOS)
-                self.bg_image = ImageTk.PhotoImage(img)
+            try:
+                from PIL import ImageTk
                 
-                if hasattr(self, 'bg_label'):
-                    self.bg_label.configure(image=self.bg_image)
-                else:
-                    self.bg_label = tk.Label(self, image=self.bg_image)
-                    self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+                # Same decoded copy the header logo is resized from: one PNG decode
+                icon = ImageTk.PhotoImage(_decoded_image(_LOGO_PATH))
+            except ImportError:
+                icon = tk.PhotoImage(file=str(_LOGO_PATH))
+            self.iconphoto(True, icon)
+        except Exception:
+            pass
+    
+    def _load_background(self):
+        """Load background image (rescaled on a worker thread)"""
+        self._resize_after_id = None
+        if not _BACKGROUND_PATH.exists():
+            return
+        
+        if self.state() == "iconic":
+            return
+        if self.winfo_ismapped():
+            size = (self.winfo_width(), self.winfo_height())
+            if min(size) < self.MIN_BG_SIZE:
+                return
+        else:
+            size = self.config.WINDOW_SIZE  # not laid out yet: it opens at this size
+        if size == self._bg_size:
+            return  # already shown (or on its way) at exactly this size
+        self._bg_size = size
+        # The window never outgrows the screen, so neither needs the cached source
+        screen = (self.winfo_screenwidth(), self.winfo_screenheight())
+        # Pillow releases the GIL while resampling, so the UI keeps running meanwhile
+        future = self._bg_executor.submit(
+            lambda: _resize_image(_decoded_image(_BACKGROUND_PATH, screen), size)
+        )
+        self._poll_background(future, size)
+    
+    def _poll_background(self, future: Future, size: tuple[int, int]):
+        """Show the rescaled background once the worker is done"""
+        if not future.done():
+            self.after(self.POLL_MS, self._poll_background, future, size)
+            return
+        if size != self._bg_size:
+            return  # a newer resize superseded this one
+        
+        try:
+            from PIL import ImageTk
+            
+            self.bg_image = ImageTk.PhotoImage(future.result())
+            
+            if hasattr(self, 'bg_label'):
+                self.bg_label.configure(image=self.bg_image)
+            else:
+                self.bg_label = tk.Label(self, image=self.bg_image)
+                self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+                self.bg_label.lower()  # may arrive after the UI is built: keep it behind
         except Exception as e:
             print(f"Background load error: {e}")
     
-    def _on_resize(self, event):
-        """Handle window resize"""
-        if event.widget == self:
-            current = (event.width, event.height)
-            if abs(current[0] - self.last_size[0]) > 50 or \
-               abs(current[1] - self.last_size[1]) > 50:
-                self.last_size = current
-                self.after(100, self._load_background)
+    def _on_resize(self, width: str, height: str):
+        """Handle window resize (only ever called for the window itself, see _setup_window)"""
+        current = (int(width), int(height))
+        if min(current) < self.MIN_BG_SIZE or self.state() == "iconic":
+            return
+        if current == self.last_size:
+            return  # moved, not resized
+        
+        # Debounce: a drag fires many events, only the last one rescales - so no
+        # size threshold is needed and the settled size is always matched exactly
+        self.last_size = current
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(self.RESIZE_DEBOUNCE_MS, self._load_background)
     
     def _build_ui(self):
         """Build user interface (Template Method)"""
@@ -115,18 +251,16 @@ class StardewCrossSaveApp(tk.Tk):
     
     def _build_header(self, parent, pad):
         """Build header with logo and title"""
-        header = tk.Frame(parent, bg=self.config.COLORS['bg_light'])
+        bg_light = self.config.COLORS['bg_light']
+        header = tk.Frame(parent, bg=bg_light)
         header.pack(fill="x", **pad)
         
-        # Logo
-        try:
-            logo_path = Path(__file__).parent.parent.parent / "assets" / "logo.png"
-            if logo_path.exists():
-                logo_img = Image.open(logo_path).resize((60, 60), Image.Resampling.LANCZOS)
-                self.logo_photo = ImageTk.PhotoImage(logo_img)
-                tk.Label(header, image=self.logo_photo, bg=self.config.COLORS['bg_light']).pack(side="left")
-        except Exception:
-            pass
+        # Logo: a blank 60x60 placeholder keeps the layout; the image follows once idle
+        if _LOGO_PATH.exists():
+            self.logo_photo = tk.PhotoImage(width=60, height=60)
+            self.logo_label = tk.Label(header, image=self.logo_photo, bg=bg_light)
+            self.logo_label.pack(side="left")
+            self.after_idle(self._load_logo)
         
         # Title
         self.widget_factory.create_label(
@@ -140,6 +274,17 @@ class StardewCrossSaveApp(tk.Tk):
             'subtitle'
         ).pack(anchor="w", padx=15, pady=(0, 5))
     
+    def _load_logo(self):
+        """Fill in the header logo (deferred so decoding doesn't hold up the first paint)"""
+        try:
+            from PIL import ImageTk
+            
+            logo_img = _resize_image(_decoded_image(_LOGO_PATH), (60, 60))
+            self.logo_photo = ImageTk.PhotoImage(logo_img)
+            self.logo_label.configure(image=self.logo_photo)
+        except Exception:
+            pass
+    
     def _build_warnings(self, parent):
         """Build warning banners"""
         # Backup warning
@@ -162,60 +307,42 @@ class StardewCrossSaveApp(tk.Tk):
     
     def _build_path_selectors(self, parent, pad):
         """Build path selection UI"""
-        # Game saves folder
-        frame = tk.Frame(parent, bg=self.config.COLORS['bg_light'])
-        frame.pack(fill="x", **pad)
-        
-        self.widget_factory.create_label(
-            frame, "📁 Game Saves Folder (the 'Saves' folder inside StardewValley):"
-        ).pack(anchor="w")
-        
-        self.widget_factory.create_label(
-            frame, "💡 Select the folder where Stardew Valley stores your save files",
-            'hint', fg=self.config.COLORS['primary_dark']
-        ).pack(anchor="w", padx=5, pady=(2, 5))
-        
-        row = tk.Frame(frame, bg=self.config.COLORS['bg_light'])
-        row.pack(fill="x", pady=5)
-        
-        self.widget_factory.create_entry(row, self.game_saves_var).pack(
-            side="left", fill="x", expand=True
+        bg = {"bg": self.config.COLORS['bg_light']}
+        hint_fg = self.config.COLORS['primary_dark']
+        selectors = (
+            ("📁 Game Saves Folder (the 'Saves' folder inside StardewValley):",
+             "💡 Select the folder where Stardew Valley stores your save files",
+             self.game_saves_var, self._pick_game_saves),
+            ("☁️ Cloud Folder (your cloud sync folder, e.g., iCloud/OneDrive):",
+             "💡 The tool will automatically create a 'Saves' subfolder here",
+             self.cloud_root_var, self._pick_cloud_root),
         )
-        self.widget_factory.create_button(
-            row, "Choose…", self._pick_game_saves, 'small'
-        ).pack(side="left", padx=(8, 4))
-        self.widget_factory.create_button(
-            row, "📂 Open", lambda: self._open_folder(self.game_saves_var.get()), 'small'
-        ).pack(side="left", padx=(4, 8))
-        
-        # Cloud folder
-        frame = tk.Frame(parent, bg=self.config.COLORS['bg_light'])
-        frame.pack(fill="x", **pad)
-        
-        self.widget_factory.create_label(
-            frame, "☁️ Cloud Folder (your cloud sync folder, e.g., iCloud/OneDrive):"
-        ).pack(anchor="w")
-        
-        self.widget_factory.create_label(
-            frame, "💡 The tool will automatically create a 'Saves' subfolder here",
-            'hint', fg=self.config.COLORS['primary_dark']
-        ).pack(anchor="w", padx=5, pady=(2, 5))
         
-        row = tk.Frame(frame, bg=self.config.COLORS['bg_light'])
-        row.pack(fill="x", pady=5)
-        
-        self.widget_factory.create_entry(row, self.cloud_root_var).pack(
-            side="left", fill="x", expand=True
-        )
-        self.widget_factory.create_button(
-            row, "Choose…", self._pick_cloud_root, 'small'
-        ).pack(side="left", padx=(8, 4))
-        self.widget_factory.create_button(
-            row, "📂 Open", lambda: self._open_folder(self.cloud_root_var.get()), 'small'
-        ).pack(side="left", padx=(4, 8))
+        for label, hint, var, pick in selectors:
+            frame = tk.Frame(parent, **bg)
+            frame.pack(fill="x", **pad)
+            
+            self.widget_factory.create_label(frame, label).pack(anchor="w")
+            
+            self.widget_factory.create_label(
+                frame, hint, 'hint', fg=hint_fg
+            ).pack(anchor="w", padx=5, pady=(2, 5))
+            
+            row = tk.Frame(frame, **bg)
+            row.pack(fill="x", pady=5)
+            
+            self.widget_factory.create_entry(row, var).pack(
+                side="left", fill="x", expand=True
+            )
+            self.widget_factory.create_button(
+                row, "Choose…", pick, 'small'
+            ).pack(side="left", padx=(8, 4))
+            self.widget_factory.create_button(
+                row, "📂 Open", partial(self._open_folder_var, var), 'small'
+            ).pack(side="left", padx=(4, 8))
         
         # Cloud target (readonly)
-        frame = tk.Frame(parent, bg=self.config.COLORS['bg_light'])
+        frame = tk.Frame(parent, **bg)
         frame.pack(fill="x", **pad)
         
         self.widget_factory.create_label(
@@ -228,11 +355,14 @@ class StardewCrossSaveApp(tk.Tk):
     
     def _build_actions(self, parent, pad):
         """Build action buttons"""
+        colors = self.config.COLORS
+        bg_light = colors['bg_light']
+        
         # Separator
-        tk.Frame(parent, height=2, bg=self.config.COLORS['primary'], 
+        tk.Frame(parent, height=2, bg=colors['primary'], 
                 relief="sunken").pack(fill="x", padx=15, pady=15)
         
-        actions = tk.Frame(parent, bg=self.config.COLORS['bg_light'])
+        actions = tk.Frame(parent, bg=bg_light)
         actions.pack(fill="x", **pad)
         
         self.widget_factory.create_label(
@@ -242,28 +372,40 @@ class StardewCrossSaveApp(tk.Tk):
         self.widget_factory.create_label(
             actions, 
             "• Copy Only: backup to cloud without linking  •  Link to Cloud: full sync setup (recommended)",
-            'hint', fg=self.config.COLORS['primary_dark']
+            'hint', fg=colors['primary_dark']
         ).pack(anchor="w", pady=(0, 10))
         
         # Main buttons
-        button_row = tk.Frame(actions, bg=self.config.COLORS['bg_light'])
+        button_row = tk.Frame(actions, bg=bg_light)
         button_row.pack(fill="x", pady=(0, 10))
         
-        self.widget_factory.create_button(
+        button = self.widget_factory.create_button(
             button_row, "📋 Copy to Cloud Only", self._migrate_to_cloud, 'secondary'
-        ).pack(side="left", padx=5, expand=True, fill="x")
+        )
+        button.pack(side="left", padx=5, expand=True, fill="x")
+        self._action_buttons.append(button)
         
-        self.widget_factory.create_button(
+        button = self.widget_factory.create_button(
             button_row, "🔗 Link to Cloud", self._link_to_cloud, 'primary'
-        ).pack(side="left", padx=5, expand=True, fill="x")
+        )
+        button.pack(side="left", padx=5, expand=True, fill="x")
+        self._action_buttons.append(button)
         
         # Restore button
-        restore_row = tk.Frame(actions, bg=self.config.COLORS['bg_light'])
+        restore_row = tk.Frame(actions, bg=bg_light)
         restore_row.pack(fill="x")
         
-        self.widget_factory.create_button(
+        button = self.widget_factory.create_button(
             restore_row, "♻️ Restore from Backup", self._restore_backup, 'restore'
-        ).pack(side="right", padx=5)
+        )
+        button.pack(side="right", padx=5)
+        self._action_buttons.append(button)
+        
+        button = self.widget_factory.create_button(
+            restore_row, "🔍 Rescan", self._rescan, 'small'
+        )
+        button.pack(side="left", padx=5)
+        self._action_buttons.append(button)
     
     def _build_log(self, parent):
         """Build log area"""
@@ -276,7 +418,7 @@ class StardewCrossSaveApp(tk.Tk):
         
         self.log = tk.Text(
             log_frame, height=10, wrap="word",
-            font=self.config.FONTS['log'],
+            font=self.widget_factory.fonts['log'],
             bg='#FFFEF0', fg=self.config.COLORS['text'],
             relief="solid", bd=1, highlightthickness=0
         )
@@ -291,13 +433,99 @@ class StardewCrossSaveApp(tk.Tk):
     def _log(self, message: str):
         """Log message to text widget"""
         self.log.insert("end", message + "\n")
+        
+        # Trim from the top once over the cap ("end-1c" is the last real line)
+        lines = int(self.log.index("end-1c").split(".")[0])
+        if lines > self.MAX_LOG_LINES:
+            self.log.delete("1.0", f"{lines - self.MAX_LOG_LINES}.0")
         self.log.see("end")
     
+    def _flush_log(self):
+        """Write log lines queued by a worker thread (Tk is only touched here)"""
+        messages = []
+        while True:
+            try:
+                messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        # One insert/see per poll tick, however many lines the worker produced
+        if messages:
+            self._log("\n".join(messages))
+    
+    def _set_busy(self, busy: bool):
+        """Disable the action buttons while a command is running"""
+        self._busy = busy
+        state = "disabled" if busy else "normal"
+        for button in self._action_buttons:
+            button.configure(state=state)
+    
+    def _run_command(self, command: Command,
+                     on_success: Optional[Callable[[OperationResult], None]] = None):
+        """Execute a command on a worker thread so the UI stays responsive"""
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        
+        def work():
+            try:
+                results.put(command.execute())
+            except Exception as e:
+                results.put(OperationResult(success=False, message=str(e)))
+        
+        self._set_busy(True)
+        threading.Thread(target=work, name="sv-command", daemon=True).start()
+        self._poll_command(results, on_success)
+    
+    def _poll_command(self, results: queue.SimpleQueue,
+                      on_success: Optional[Callable[[OperationResult], None]]):
+        """Drain the worker's log lines; report its result once it has finished"""
+        from tkinter import messagebox
+        
+        self._flush_log()
+        try:
+            result = results.get_nowait()
+        except queue.Empty:
+            self.after(self.POLL_MS, self._poll_command, results, on_success)
+            return
+        
+        self._flush_log()
+        self._set_busy(False)
+        if result.success:
+            if on_success:
+                on_success(result)
+            messagebox.showinfo(self.config.APP_TITLE, result.message)
+        else:
+            messagebox.showerror(self.config.APP_TITLE, result.message)
+    
+    def _on_close(self):
+        """Refuse to close mid-operation (would interrupt a copy halfway)"""
+        from tkinter import messagebox
+        
+        if self._busy:
+            messagebox.showwarning(
+                self.config.APP_TITLE,
+                "An operation is still running. Please wait for it to finish."
+            )
+            return
+        self._bg_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+    
     def _auto_detect(self):
-        """Auto-detect game installation and saves"""
+        """Auto-detect game installation and saves (disk scans run off the UI thread)"""
+        executor = self.config.executor
+        install = executor.submit(self.game_detector.find_installation)
+        saves = executor.submit(self.game_detector.find_saves_path)
+        self._poll_auto_detect(install, saves)
+    
+    def _poll_auto_detect(self, install: Future, saves: Future):
+        """Report detection results once both scans have finished"""
+        from tkinter import messagebox
+        
+        if not (install.done() and saves.done()):
+            self.after(self.POLL_MS, self._poll_auto_detect, install, saves)
+            return
+        
         # Detect installation
         try:
-            game_path = self.game_detector.find_installation()
+            game_path = install.result()
             if game_path:
                 self._log(f"[AUTO-DETECT] Game found at: {game_path}")
             else:
@@ -310,18 +538,35 @@ class StardewCrossSaveApp(tk.Tk):
         except Exception as e:
             self._log(f"[WARNING] Game detection error: {e}")
         
-        # Detect saves
-        saves_path = self.game_detector.find_saves_path()
+        # Detect saves (only fills an empty field or the previous detection, so a
+        # folder the user picked meanwhile is kept)
+        saves_path = saves.result()
+        current = self.game_saves_var.get()
+        if current and current != self._detected_saves:
+            if saves_path and str(saves_path) != current:
+                self._log(f"[AUTO-DETECT] Saves found at: {saves_path} (keeping the selected folder)")
+            return
         if saves_path:
+            self._detected_saves = str(saves_path)
             self.game_saves_var.set(str(saves_path))
             self._log(f"[AUTO-DETECT] Saves found at: {saves_path}")
             self._recompute_cloud_target()
         else:
             self._log("[INFO] Saves not auto-detected. Select manually.")
     
+    def _rescan(self):
+        """Forget cached detection results and detect again (user requested)"""
+        self.game_detector.invalidate()
+        self._log("[AUTO-DETECT] Rescanning...")
+        self._auto_detect()
+    
     def _recompute_cloud_target(self):
         """Recompute cloud saves path"""
         cloud_root = self.cloud_root_var.get().strip()
+        if cloud_root == self._last_cloud_root:
+            return  # target only depends on the cloud root
+        self._last_cloud_root = cloud_root
+        
         if cloud_root:
             self.cloud_saves_var.set(FileOperations.normalize_path(
                 str(Path(cloud_root) / "Saves")
@@ -331,6 +576,8 @@ class StardewCrossSaveApp(tk.Tk):
     
     def _pick_game_saves(self):
         """Pick game saves folder"""
+        from tkinter import filedialog
+        
         path = filedialog.askdirectory(title="Select the game Saves folder")
         if path:
             self.game_saves_var.set(FileOperations.normalize_path(path))
@@ -338,6 +585,8 @@ class StardewCrossSaveApp(tk.Tk):
     
     def _pick_cloud_root(self):
         """Pick cloud root folder"""
+        from tkinter import filedialog
+        
         path = filedialog.askdirectory(title="Select the Cloud folder")
         if path:
             self.cloud_root_var.set(FileOperations.normalize_path(path))
@@ -351,70 +600,102 @@ class StardewCrossSaveApp(tk.Tk):
         
         if not game_saves or not cloud_root:
             raise ValueError("Select both game Saves and Cloud folders")
-        if not FileOperations.path_exists(game_saves):
-            raise ValueError("Game Saves folder doesn't exist")
-        if not FileOperations.path_exists(cloud_root):
-            raise ValueError("Cloud folder doesn't exist")
         if not cloud_saves:
             raise ValueError("Invalid cloud target")
+        # One stat each, and only once the cheap checks have passed
+        if not FileOperations.is_directory(game_saves):
+            raise ValueError("Game Saves folder doesn't exist")
+        if not FileOperations.is_directory(cloud_root):
+            raise ValueError("Cloud folder doesn't exist")
         
         return Path(game_saves), Path(cloud_root), Path(cloud_saves)
     
     def _migrate_to_cloud(self):
         """Execute migrate command"""
+        from tkinter import messagebox
+        
         try:
             game_saves, _, cloud_saves = self._validate_paths()
             
-            command = MigrateCommand(game_saves, cloud_saves, self._log)
-            result = command.execute()
-            
-            if result.success:
-                messagebox.showinfo(self.config.APP_TITLE, result.message)
-            else:
-                messagebox.showerror(self.config.APP_TITLE, result.message)
+            command = MigrateCommand(game_saves, cloud_saves, self._log_queue.put)
+            self._run_command(command, self._saves_changed)
         except Exception as e:
             messagebox.showerror(self.config.APP_TITLE, str(e))
             self._log(f"[ERROR] {e}")
     
     def _link_to_cloud(self):
         """Execute link command"""
+        from tkinter import messagebox
+        
         try:
             game_saves, _, cloud_saves = self._validate_paths()
             
             command = LinkCommand(game_saves, cloud_saves, self.link_strategy, 
-                                self.config, self._log)
-            result = command.execute()
-            
-            if result.success:
-                self.last_backup = result.backup_path
-                messagebox.showinfo(self.config.APP_TITLE, result.message)
-            else:
-                messagebox.showerror(self.config.APP_TITLE, result.message)
+                                self.config, self._log_queue.put)
+            self._run_command(command, self._remember_backup)
         except Exception as e:
             messagebox.showerror(self.config.APP_TITLE, str(e))
             self._log(f"[ERROR] {e}")
     
+    def _load_last_backup(self) -> Optional[Path]:
+        """Last link backup saved by a previous session, if it is still on disk"""
+        try:
+            data = json.loads(self.config.STATE_PATH.read_text(encoding="utf-8"))
+            backup = Path(data["backup_path"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return backup if backup.is_dir() else None
+    
+    def _saves_changed(self, result: OperationResult):
+        """A command rewrote the Saves folders: cached directory listings are stale"""
+        self.game_detector.invalidate()
+    
+    def _remember_backup(self, result: OperationResult):
+        """Keep the link backup so it can be restored later (also after a restart)"""
+        self._saves_changed(result)
+        self.last_backup = result.backup_path
+        if self.last_backup is None:
+            return
+        
+        state = {"backup_path": str(self.last_backup), "ts": time.time()}
+        try:
+            self.config.STATE_PATH.write_text(json.dumps(state), encoding="utf-8")
+        except OSError as e:
+            self._log(f"[WARNING] Could not save backup location: {e}")
+    
+    def _forget_backup(self, result: OperationResult):
+        """The last backup has been restored: don't offer it again (nor after a restart)"""
+        self._saves_changed(result)
+        self.last_backup = None
+        try:
+            self.config.STATE_PATH.unlink(missing_ok=True)
+        except OSError as e:
+            self._log(f"[WARNING] Could not clear backup location: {e}")
+    
     def _restore_backup(self):
         """Execute restore command"""
+        from tkinter import messagebox
+        
         try:
             game_saves = self.game_saves_var.get().strip()
             if not game_saves:
                 raise ValueError("Select game Saves folder first")
             
             command = RestoreCommand(Path(game_saves), self.last_backup, 
-                                   self.link_strategy, self._log)
-            result = command.execute()
-            
-            if result.success:
-                messagebox.showinfo(self.config.APP_TITLE, result.message)
-            else:
-                messagebox.showerror(self.config.APP_TITLE, result.message)
+                                   self.link_strategy, self._log_queue.put)
+            self._run_command(command, self._forget_backup)
         except Exception as e:
             messagebox.showerror(self.config.APP_TITLE, str(e))
             self._log(f"[ERROR] {e}")
     
+    def _open_folder_var(self, var: tk.StringVar):
+        """Open the folder a path variable currently holds"""
+        self._open_folder(var.get())
+    
     def _open_folder(self, path: str):
         """Open folder in file explorer"""
+        from tkinter import messagebox
+        
         if not path or not path.strip():
             messagebox.showwarning(self.config.APP_TITLE, "No path selected")
             return
@@ -432,15 +713,9 @@ class StardewCrossSaveApp(tk.Tk):
         # Open in file explorer
         try:
             import subprocess
-            import platform
             
-            system = platform.system()
-            if system == "Windows":
-                subprocess.run(["explorer", str(folder_path)])
-            elif system == "Darwin":  # macOS
-                subprocess.run(["open", str(folder_path)])
-            else:  # Linux
-                subprocess.run(["xdg-open", str(folder_path)])
+            # Fire and forget: waiting on explorer/open/xdg-open would block the event loop
+            subprocess.Popen([_FOLDER_OPENER, str(folder_path)], close_fds=True)
             
             self._log(f"[INFO] Opened folder: {folder_path}")
         except Exception as e:
@@ -1,14 +1,58 @@
 """Widget Factory - Factory Pattern for UI widget creation (DRY)"""
 
 import tkinter as tk
+from tkinter import font as tkfont
 from ..config import Config
 
 
 class WidgetFactory:
     """Factory for creating styled widgets (reduces code duplication)"""
     
+    # Options shared by every button, whatever its style
+    _BUTTON_BASE = {
+        'relief': "solid",
+        'bd': 2,
+        'cursor': "hand2",
+        'padx': 15,
+        'pady': 10,
+    }
+    # Banner message color per banner background (anything else gets _BANNER_FG_DEFAULT)
+    _BANNER_FG = {'#FFE5E5': '#8B0000'}
+    _BANNER_FG_DEFAULT = '#BF360C'
+    
     def __init__(self, config: Config):
         self.config = config
+        
+        # One named Tk font per style, shared by every widget (needs the Tk root to exist)
+        self.fonts = {key: tkfont.Font(font=spec) for key, spec in config.FONTS.items()}
+        
+        # Resolved once here rather than rebuilt on every create_button call
+        self._button_styles = {
+            'primary': {
+                'bg': config.COLORS['primary_dark'],
+                'fg': config.COLORS['button_text'],
+                'font': self.fonts['button']
+            },
+            'secondary': {
+                'bg': config.COLORS['bg_dark'],
+                'fg': config.COLORS['button_text'],
+                'font': self.fonts['button']
+            },
+            'small': {
+                'bg': config.COLORS['button'],
+                'fg': config.COLORS['button_text'],
+                'font': self.fonts['button_small']
+            },
+            'restore': {
+                'bg': config.COLORS['bg'],
+                'fg': config.COLORS['primary_dark'],
+                'font': self.fonts['button_small']
+            }
+        }
+        # Fold the shared options in too, so create_button passes one ready-made dict
+        for style_config in self._button_styles.values():
+            style_config.update(self._BUTTON_BASE,
+                                activebackground=config.COLORS['button_hover'])
     
     def create_label(self, parent, text: str, font_key: str = 'label', 
                     fg: str = None, **kwargs) -> tk.Label:
@@ -16,7 +60,7 @@ class WidgetFactory:
         return tk.Label(
             parent,
             text=text,
-            font=self.config.FONTS[font_key],
+            font=self.fonts[font_key],
             fg=fg or self.config.COLORS['text'],
             bg=self.config.COLORS['bg_light'],
             **kwargs
@@ -30,7 +74,7 @@ class WidgetFactory:
             parent,
             textvariable=textvariable,
             state=state,
-            font=self.config.FONTS['entry'],
+            font=self.fonts['entry'],
             bg=bg,
             fg=self.config.COLORS['text'],
             relief="solid",
@@ -41,44 +85,13 @@ class WidgetFactory:
     def create_button(self, parent, text: str, command, style: str = 'primary', 
                      **kwargs) -> tk.Button:
         """Create a styled button"""
-        styles = {
-            'primary': {
-                'bg': self.config.COLORS['primary_dark'],
-                'fg': self.config.COLORS['button_text'],
-                'font': self.config.FONTS['button']
-            },
-            'secondary': {
-                'bg': self.config.COLORS['bg_dark'],
-                'fg': self.config.COLORS['button_text'],
-                'font': self.config.FONTS['button']
-            },
-            'small': {
-                'bg': self.config.COLORS['button'],
-                'fg': self.config.COLORS['button_text'],
-                'font': self.config.FONTS['button_small']
-            },
-            'restore': {
-                'bg': self.config.COLORS['bg'],
-                'fg': self.config.COLORS['primary_dark'],
-                'font': self.config.FONTS['button_small']
-            }
-        }
-        
-        style_config = styles.get(style, styles['primary'])
+        style_config = self._button_styles.get(style, self._button_styles['primary'])
         
         return tk.Button(
             parent,
             text=text,
             command=command,
-            bg=style_config['bg'],
-            fg=style_config['fg'],
-            font=style_config['font'],
-            activebackground=self.config.COLORS['button_hover'],
-            relief="solid",
-            bd=2,
-            cursor="hand2",
-            padx=15,
-            pady=10,
+            **style_config,
             **kwargs
         )
     
@@ -90,7 +103,7 @@ class WidgetFactory:
         icon_label = tk.Label(
             frame,
             text=icon,
-            font=("Arial", 28),
+            font=self.fonts['banner_icon'],
             bg=bg_color,
             fg=self.config.COLORS['error']
         )
@@ -103,7 +116,7 @@ class WidgetFactory:
             tk.Label(
                 content,
                 text=title,
-                font=("Georgia", 11, "bold"),
+                font=self.fonts['banner_title'],
                 bg=bg_color,
                 fg='#8B0000',
                 justify="left"
@@ -112,9 +125,9 @@ class WidgetFactory:
         tk.Label(
             content,
             text=message,
-            font=("Georgia", 10, "bold"),
+            font=self.fonts['banner_text'],
             bg=bg_color,
-            fg='#8B0000' if 'FFE5E5' in bg_color else '#BF360C',
+            fg=self._BANNER_FG.get(bg_color, self._BANNER_FG_DEFAULT),
             justify="left",
             wraplength=750
         ).pack(anchor="w")